@@ -12,6 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Union
 
 import numpy as np
@@ -21,23 +26,92 @@ from transformers import (BertConfig, BertPreTrainedModel, RobertaConfig,
 
 import tensorrt_llm
 
+# Classifies a HF state_dict key with a single match: either an embedding
+# parameter or a per-layer parameter with its layer index and suffix.
+LAYER_RE = re.compile(
+    r'(?:^|\.)(?:(?P<embedding>embeddings)|layer\.(?P<layer>\d+))\.(?P<suffix>.+)$'
+)
 
-def extract_layer_idx(name):
-    ss = name.split('.')
-    for s in ss:
-        if s.isdigit():
-            return s
-    return None
+# HF embedding suffix -> attribute path under `tensorrt_llm_model.embedding`.
+EMBEDDING_PATTERNS = {
+    'word_embeddings.weight': 'vocab_embedding.weight',
+    'position_embeddings.weight': 'position_embedding.weight',
+    'token_type_embeddings.weight': 'token_embedding.weight',
+    'LayerNorm.weight': 'embedding_ln.weight',
+    'LayerNorm.bias': 'embedding_ln.bias',
+}
+
+# HF per-layer suffix -> (attribute path under the TRT-LLM layer, TP split
+# dim or None). The 'qkv_weight'/'qkv_bias' tags buffer Q/K/V for fusion,
+# with the second element selecting the q/k/v slot.
+LAYER_PATTERNS = {
+    'attention.output.dense.weight': ('attention.dense.weight', 1),
+    'attention.output.dense.bias': ('attention.dense.bias', None),
+    'attention.output.LayerNorm.weight': ('input_layernorm.weight', None),
+    'attention.output.LayerNorm.bias': ('input_layernorm.bias', None),
+    'intermediate.dense.weight': ('mlp.fc.weight', 0),
+    'intermediate.dense.bias': ('mlp.fc.bias', 0),
+    'output.dense.weight': ('mlp.proj.weight', 1),
+    'output.dense.bias': ('mlp.proj.bias', None),
+    'output.LayerNorm.weight': ('post_layernorm.weight', None),
+    'output.LayerNorm.bias': ('post_layernorm.bias', None),
+    'attention.self.query.weight': ('qkv_weight', 0),
+    'attention.self.query.bias': ('qkv_bias', 0),
+    'attention.self.key.weight': ('qkv_weight', 1),
+    'attention.self.key.bias': ('qkv_bias', 1),
+    'attention.self.value.weight': ('qkv_weight', 2),
+    'attention.self.value.bias': ('qkv_bias', 2),
+}
+
+
+class _PinnedStager:
+    """Double-buffered pinned staging for device-to-host weight copies.
+
+    The copy of the next tensor is issued asynchronously on a dedicated
+    stream while the previous tensor is still being sharded and committed,
+    hiding most of the transfer latency behind host-side work.
+    """
+
+    def __init__(self, torch_dtype):
+        self._dtype = torch_dtype
+        self._stream = torch.cuda.Stream()
+        self._bufs = [None, None]
+        self._events = [torch.cuda.Event(), torch.cuda.Event()]
+        self._turn = 0
+
+    def stage(self, v):
+        """Start an async cast + copy of `v` into a pinned buffer."""
+        slot = self._turn
+        self._turn ^= 1
+        numel = v.numel()
+        buf = self._bufs[slot]
+        if buf is None or buf.numel() < numel:
+            buf = torch.empty(numel, dtype=self._dtype, pin_memory=True)
+            self._bufs[slot] = buf
+        with torch.cuda.stream(self._stream):
+            staged = v.reshape(-1).to(self._dtype, non_blocking=True)
+            buf[:numel].copy_(staged, non_blocking=True)
+            self._events[slot].record(self._stream)
+        return slot, tuple(v.shape)
+
+    def fetch_into(self, slot, dst):
+        """Wait for the staged copy and write it into the numpy array."""
+        self._events[slot].synchronize()
+        np.copyto(dst, self._bufs[slot][:dst.size].view(dst.shape).numpy())
 
 
 def split(v, tp_size, idx, dim=0):
     if tp_size == 1:
         return v
     if len(v.shape) == 1:
-        return np.ascontiguousarray(np.split(v, tp_size)[idx].copy())
-    elif len(v.shape) == 2:
-        return np.ascontiguousarray(np.split(v, tp_size, axis=dim)[idx].copy())
-    return None
+        dim = 0
+    elif len(v.shape) != 2:
+        return None
+    # Slice this rank's shard directly; the slice is a view and
+    # ascontiguousarray performs the single copy into an owned buffer.
+    chunk = v.shape[dim] // tp_size
+    sl = (slice(None), ) * dim + (slice(idx * chunk, (idx + 1) * chunk), )
+    return np.ascontiguousarray(v[sl])
 
 
 def load_from_hf_model(tensorrt_llm_model: tensorrt_llm.module.Module,
@@ -46,76 +120,131 @@ def load_from_hf_model(tensorrt_llm_model: tensorrt_llm.module.Module,
                        hf_model_config: Union[BertConfig, RobertaConfig],
                        rank=0,
                        tensor_parallel=1,
-                       fp16=False):
-    qkv_weight = [[None, None, None]
-                  for _ in range(hf_model_config.num_hidden_layers)]
+                       fp16=False,
+                       extra_keys=None):
+    num_layers = hf_model_config.num_hidden_layers
+    hidden = hf_model_config.hidden_size
+    torch_dtype = torch.float16 if fp16 else torch.float32
+    np_dtype = np.float16 if fp16 else np.float32
 
-    qkv_bias = [[None, None, None]
-                for _ in range(hf_model_config.num_hidden_layers)]
+    # Per-layer fused QKV buffers. Q/K/V land directly in their slice of
+    # the fused array, so no concatenate pass (and its extra copy) is
+    # needed; each buffer is allocated on first touch and handed off to
+    # the model once its third slice arrives.
+    qkv_weight = [None] * num_layers
+    qkv_bias = [None] * num_layers
+    qkv_w_filled = [0] * num_layers
+    qkv_b_filled = [0] * num_layers
+    # Tensors listed in extra_keys (e.g. QA/classifier heads) are captured
+    # during this same pass so callers do not re-materialize the state dict.
+    extras = {}
 
-    torch_dtype = torch.float16 if fp16 else torch.float32
-    for k, v in hf_model.state_dict().items():
-        v = v.to(torch_dtype).cpu().numpy()
-        if 'embeddings.word_embeddings.weight' in k:
-            tensorrt_llm_model.embedding.vocab_embedding.weight.value = v
-        elif 'embeddings.position_embeddings.weight' in k:
-            tensorrt_llm_model.embedding.position_embedding.weight.value = v
-        elif 'embeddings.token_type_embeddings.weight' in k:
-            tensorrt_llm_model.embedding.token_embedding.weight.value = v
-        elif 'embeddings.LayerNorm.weight' in k:
-            tensorrt_llm_model.embedding.embedding_ln.weight.value = v
-        elif 'embeddings.LayerNorm.bias' in k:
-            tensorrt_llm_model.embedding.embedding_ln.bias.value = v
+    stager = _PinnedStager(torch_dtype) if torch.cuda.is_available() else None
+    # Casts of host-resident tensors run on a thread pool (torch and numpy
+    # release the GIL in their copy kernels); GPU tensors go through the
+    # double-buffered stager instead. Entries are drained FIFO so commits
+    # happen in push order on this thread only.
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_in_flight = 2 * max_workers
+    in_flight = deque()
+    pool = None
+
+    def _commit(param, v, dim):
+        if dim is not None:
+            v = split(v, tensor_parallel, rank, dim=dim)
+        param.value = v
+
+    def _cast_into(dst, v):
+        # copy=False keeps .to() a no-op when dtype and device already match.
+        np.copyto(dst, v.detach().to(torch_dtype, copy=False).cpu().numpy())
+
+    def _drain(limit=0):
+        while len(in_flight) > limit:
+            entry = in_flight.popleft()
+            if entry[0] == 'gpu':
+                _, slot, dst, after = entry
+                stager.fetch_into(slot, dst)
+            else:
+                _, future, after = entry
+                future.result()
+            if after is not None:
+                after()
+
+    def _push(v, dst, after):
+        # Land `v` in the host array `dst`, then run `after` (if any) to
+        # commit it; the copy overlaps earlier commits and casts.
+        if stager is not None and v.is_cuda:
+            slot, _ = stager.stage(v.detach())
+            _drain()
+            in_flight.append(('gpu', slot, dst, after))
         else:
-            layer_idx = extract_layer_idx(k)
-            if layer_idx is None:
+            in_flight.append(('cpu', pool.submit(_cast_into, dst, v), after))
+            _drain(max_in_flight)
+
+    def _assign(param, v, dim):
+        if v.device.type == 'cpu' and v.dtype == torch_dtype:
+            # Already host-resident in the target dtype: commit the tensor's
+            # own buffer directly instead of casting into a fresh array.
+            _drain()
+            _commit(param, v.detach().numpy(), dim)
+            return
+        dst = np.empty(tuple(v.shape), np_dtype)
+        _push(v, dst, lambda: _commit(param, dst, dim))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Parameters are streamed with a bounded in-flight window, so only a
+        # handful of converted host copies are alive at once; a layer's fused
+        # QKV buffer is committed and released as soon as all three slices
+        # have been seen.
+        for k, v in hf_model.named_parameters():
+            if extra_keys is not None and k in extra_keys:
+                extras[k] = v.detach()
+                continue
+            m = LAYER_RE.search(k)
+            if m is None:
                 continue
-            idx = int(layer_idx)
-            if 'attention.output.dense.weight' in k:
-                tensorrt_llm_model.layers[
-                    idx].attention.dense.weight.value = split(v,
-                                                              tensor_parallel,
-                                                              rank,
-                                                              dim=1)
-            elif 'attention.output.dense.bias' in k:
-                tensorrt_llm_model.layers[idx].attention.dense.bias.value = v
-            elif 'attention.output.LayerNorm.weight' in k:
-                tensorrt_llm_model.layers[idx].input_layernorm.weight.value = v
-            elif 'attention.output.LayerNorm.bias' in k:
-                tensorrt_llm_model.layers[idx].input_layernorm.bias.value = v
-            elif 'intermediate.dense.weight' in k:
-                tensorrt_llm_model.layers[idx].mlp.fc.weight.value = split(
-                    v, tensor_parallel, rank)
-            elif 'intermediate.dense.bias' in k:
-                tensorrt_llm_model.layers[idx].mlp.fc.bias.value = split(
-                    v, tensor_parallel, rank)
-            elif 'output.dense.weight' in k:
-                tensorrt_llm_model.layers[idx].mlp.proj.weight.value = split(
-                    v, tensor_parallel, rank, dim=1)
-            elif 'output.dense.bias' in k:
-                tensorrt_llm_model.layers[idx].mlp.proj.bias.value = v
-            elif 'output.LayerNorm.weight' in k:
-                tensorrt_llm_model.layers[idx].post_layernorm.weight.value = v
-            elif 'output.LayerNorm.bias' in k:
-                tensorrt_llm_model.layers[idx].post_layernorm.bias.value = v
-            elif 'attention.self.query.weight' in k:
-                qkv_weight[idx][0] = v
-            elif 'attention.self.query.bias' in k:
-                qkv_bias[idx][0] = v
-            elif 'attention.self.key.weight' in k:
-                qkv_weight[idx][1] = v
-            elif 'attention.self.key.bias' in k:
-                qkv_bias[idx][1] = v
-            elif 'attention.self.value.weight' in k:
-                qkv_weight[idx][2] = v
-            elif 'attention.self.value.bias' in k:
-                qkv_bias[idx][2] = v
-
-    for i in range(hf_model_config.num_hidden_layers):
-        tensorrt_llm_model.layers[i].attention.qkv.weight.value = split(
-            np.concatenate(qkv_weight[i]), tensor_parallel, rank)
-        tensorrt_llm_model.layers[i].attention.qkv.bias.value = split(
-            np.concatenate(qkv_bias[i]), tensor_parallel, rank)
+            if m.group('layer') is None:
+                target = EMBEDDING_PATTERNS.get(m.group('suffix'))
+                if target is not None:
+                    _assign(
+                        attrgetter(target)(tensorrt_llm_model.embedding), v,
+                        None)
+                continue
+            spec = LAYER_PATTERNS.get(m.group('suffix'))
+            if spec is None:
+                continue
+            target, dim = spec
+            idx = int(m.group('layer'))
+            if target == 'qkv_weight':
+                buf = qkv_weight[idx]
+                if buf is None:
+                    buf = np.empty((3 * hidden, hidden), np_dtype)
+                    qkv_weight[idx] = buf
+                after = None
+                qkv_w_filled[idx] += 1
+                if qkv_w_filled[idx] == 3:
+                    qkv_weight[idx] = None
+                    param = tensorrt_llm_model.layers[idx].attention.qkv.weight
+                    after = lambda b=buf, p=param: _commit(p, b, 0)
+                _push(v, buf[dim * hidden:(dim + 1) * hidden], after)
+            elif target == 'qkv_bias':
+                buf = qkv_bias[idx]
+                if buf is None:
+                    buf = np.empty((3 * hidden, ), np_dtype)
+                    qkv_bias[idx] = buf
+                after = None
+                qkv_b_filled[idx] += 1
+                if qkv_b_filled[idx] == 3:
+                    qkv_bias[idx] = None
+                    param = tensorrt_llm_model.layers[idx].attention.qkv.bias
+                    after = lambda b=buf, p=param: _commit(p, b, 0)
+                _push(v, buf[dim * hidden:(dim + 1) * hidden], after)
+            else:
+                _assign(
+                    attrgetter(target)(tensorrt_llm_model.layers[idx]), v, dim)
+
+    _drain()
+    return extras
 
 
 def load_from_hf_qa_model(tensorrt_llm_qa_model: tensorrt_llm.module.Module,
@@ -125,9 +254,14 @@ def load_from_hf_qa_model(tensorrt_llm_qa_model: tensorrt_llm.module.Module,
                           rank=0,
                           tensor_parallel=1,
                           fp16=False):
-    load_from_hf_model(tensorrt_llm_qa_model.bert, hf_qa_model, hf_bert_config,
-                       rank, tensor_parallel, fp16)
-    states = hf_qa_model.state_dict()
+    states = load_from_hf_model(
+        tensorrt_llm_qa_model.bert,
+        hf_qa_model,
+        hf_bert_config,
+        rank,
+        tensor_parallel,
+        fp16,
+        extra_keys=['qa_outputs.weight', 'qa_outputs.bias'])
 
     torch_dtype = torch.float16 if fp16 else torch.float32
 
@@ -145,9 +279,23 @@ def load_from_hf_cls_model(tensorrt_llm_cls_model: tensorrt_llm.models.
                            rank=0,
                            tensor_parallel=1,
                            fp16=False):
-    load_from_hf_model(tensorrt_llm_cls_model.bert, hf_qa_model, hf_bert_config,
-                       rank, tensor_parallel, fp16)
-    states = hf_qa_model.state_dict()
+    if isinstance(hf_qa_model, BertPreTrainedModel):
+        extra_keys = [
+            'bert.pooler.dense.weight', 'bert.pooler.dense.bias',
+            'classifier.weight', 'classifier.bias'
+        ]
+    else:
+        extra_keys = [
+            'classifier.dense.weight', 'classifier.dense.bias',
+            'classifier.out_proj.weight', 'classifier.out_proj.bias'
+        ]
+    states = load_from_hf_model(tensorrt_llm_cls_model.bert,
+                                hf_qa_model,
+                                hf_bert_config,
+                                rank,
+                                tensor_parallel,
+                                fp16,
+                                extra_keys=extra_keys)
 
     torch_dtype = torch.float16 if fp16 else torch.float32
 
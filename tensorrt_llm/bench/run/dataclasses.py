@@ -4,6 +4,7 @@ from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, List, Optional
 
+import numpy as np
 from pydantic import (BaseModel, Field, PositiveFloat, computed_field,
                       model_validator)
 
@@ -158,16 +159,29 @@ class PercentileStats(BaseModel):
 
     @classmethod
     def from_iterable(cls, values: List[Any]) -> PercentileStats:
-        length = len(values)
-        sorted_values = sorted(values)
-        return cls(
-            p50=sorted_values[int(length * 0.50)],
-            p95=sorted_values[int(length * 0.95)],
-            p99=sorted_values[int(length * 0.99)],
-            average=float(sum(values)) / length,
-            minimum=min(values),
-            maximum=max(values),
-        )
+        return cls.from_matrix(
+            np.asarray(values, dtype=np.float64)[np.newaxis, :])[0]
+
+    @classmethod
+    def from_matrix(cls, mat: np.ndarray) -> List[PercentileStats]:
+        """Build one PercentileStats per row of `mat`.
+
+        All rows share a single np.partition pass (introselect, O(N) per
+        row) instead of fully sorting each metric separately.
+        """
+        length = mat.shape[1]
+        idx = (np.array([0.50, 0.95, 0.99]) * length).astype(int)
+        part = np.partition(mat, idx, axis=1)[:, idx]
+        return [
+            cls(
+                p50=part[i, 0],
+                p95=part[i, 1],
+                p99=part[i, 2],
+                average=row.mean(),
+                minimum=row.min(),
+                maximum=row.max(),
+            ) for i, row in enumerate(mat)
+        ]
 
 
 class BenchmarkStatistics(BaseModel):
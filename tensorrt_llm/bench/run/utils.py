@@ -1,17 +1,32 @@
 from __future__ import annotations
 
-import json
-from collections import defaultdict, namedtuple
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple, Union
 
+import numpy as np
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 import tensorrt_llm.bindings.executor as trtllm
 from tensorrt_llm.bench.run.dataclasses import (BenchmarkStatistics,
-                                                PercentileStats, RequestRecord)
+                                                PercentileStats)
 from tensorrt_llm.bindings import InferenceRequest
 
-ResponseTuple = namedtuple(
-    "ResponseTuple", ["timestamp", "request_id", "final", "error", "tokens"])
+
+@dataclass(slots=True)
+class ResponseTuple:
+    """Transport struct for executor responses; one is allocated per
+    response, so attribute access is a fixed slot load rather than a
+    namedtuple index plus name resolution."""
+    timestamp: float
+    request_id: int
+    final: bool
+    error: bool
+    tokens: List[int]
 
 
 def get_executor_request(request: InferenceRequest,
@@ -36,8 +51,8 @@ def get_settings_from_engine(
     config_path = engine_path / "config.json"
     runtime_config = {}
 
-    with open(config_path, "r") as config_json:
-        config = json.load(config_json)
+    with open(config_path, "rb") as config_json:
+        config = json_loads(config_json.read())
 
     engine_world_map = config["pretrained_config"]["mapping"]
     engine_build_cfg = config["build_config"]
@@ -66,64 +81,96 @@ def get_settings_from_engine(
 
 
 class StatsKeeper:
+    """Structure-of-arrays store for per-request benchmark timings.
+
+    Records live in parallel numpy arrays indexed by a request-id -> slot
+    map, so the summary pass runs as vectorized reductions instead of a
+    Python loop over per-request objects.
+    """
+
+    _INITIAL_CAPACITY: int = 1024
+    _FIELDS: Tuple[str, ...] = ("start", "first", "end", "in_tok", "out_tok",
+                                "err_tok")
 
     def __init__(self) -> None:
-        self.requests: Dict[RequestRecord] = defaultdict(RequestRecord)
+        self._slots: Dict[int, int] = {}
+        self._num_records: int = 0
+        self._arr: Dict[str, np.ndarray] = {
+            field: np.full(self._INITIAL_CAPACITY, -1, dtype=np.int64)
+            for field in self._FIELDS
+        }
+        self._arr["out_tok"][:] = 0
+        self._arr["err_tok"][:] = 0
         self.num_complete: int = 0
 
+    def _get_slot(self, request_id: int) -> int:
+        slot = self._slots.get(request_id)
+        if slot is None:
+            capacity = self._arr["start"].shape[0]
+            if self._num_records == capacity:
+                # Grow geometrically to keep appends amortized O(1).
+                for field in self._FIELDS:
+                    grown = np.full(capacity * 2, -1, dtype=np.int64)
+                    grown[:capacity] = self._arr[field]
+                    if field in ("out_tok", "err_tok"):
+                        grown[capacity:] = 0
+                    self._arr[field] = grown
+            slot = self._num_records
+            self._slots[request_id] = slot
+            self._num_records += 1
+        return slot
+
     def register_request(
         self,
         request_id: int,
         timestamp: float,
         num_tokens: int,
     ) -> None:
-        record = self.requests[request_id]
-        record.num_input_tokens = num_tokens
-        record.start_timestamp = timestamp
+        slot = self._get_slot(request_id)
+        self._arr["start"][slot] = timestamp
+        self._arr["in_tok"][slot] = num_tokens
 
     def register_response(self, request_id: int, timestamp: int, final: bool,
                           error: bool, tokens: List[int]) -> None:
-        record = self.requests[request_id]
-        record.register_event(error, final, timestamp, tokens)
+        slot = self._get_slot(request_id)
         if final:
+            self._arr["end"][slot] = timestamp
             self.num_complete = self.num_complete + 1
+        elif self._arr["first"][slot] == -1:
+            self._arr["first"][slot] = timestamp
+
+        if error:
+            self._arr["err_tok"][slot] += 1
+        self._arr["out_tok"][slot] += len(tokens)
 
     def generate_statistics_summary(self) -> None:
-        total_output_tokens: int = 0
-        total_input_tokens: int = 0
-        num_requests = len(self.requests)
-        start_time = float("inf")
-        end_time = -1
-
-        request_latencies = []
-        intertoken_avg_latencies = []
-        ttft_times = []
-        last_queue_time = 0.0
-        queue_time_total = 0.0
-
-        for entry in self.requests.values():
-            start_time = min(entry.start_timestamp, start_time)
-            end_time = max(entry.end_timestamp, end_time)
-            queue_time_total += entry.start_timestamp - last_queue_time
-            last_queue_time = entry.start_timestamp
-
-            request_latencies.append(entry.end_to_end_latency)
-            ttft_times.append(entry.time_to_first_token)
-            intertoken_avg_latencies.append(entry.intertoken_latency)
-
-            total_output_tokens += entry.num_output_tokens
-            total_input_tokens += entry.num_input_tokens
+        num_requests = self._num_records
+        start = self._arr["start"][:num_requests]
+        first = self._arr["first"][:num_requests]
+        end = self._arr["end"][:num_requests]
+        in_tok = self._arr["in_tok"][:num_requests]
+        out_tok = self._arr["out_tok"][:num_requests]
+
+        # Sort before differencing so the issue rate is well-defined even
+        # when requests were registered out of submission order.
+        queue_time_total = float(np.diff(np.sort(start)).sum())
+
+        # One partition pass yields the percentiles for all three metrics.
+        request_pcts, itl_pcts, ttft_pcts = PercentileStats.from_matrix(
+            np.stack([
+                end - start,
+                (end - first) / (out_tok - 1),
+                first - start,
+            ]))
 
         stats = BenchmarkStatistics(
             num_requests=num_requests,
-            total_latency_ns=end_time - start_time,
-            total_output_tokens=total_output_tokens,
-            total_input_tokens=total_input_tokens,
-            request_percentiles=PercentileStats.from_iterable(
-                request_latencies),
-            itl_percentiles=PercentileStats.from_iterable(
-                intertoken_avg_latencies),
-            ttft_percentiles=PercentileStats.from_iterable(ttft_times),
+            total_latency_ns=float(end.max() - start.min()),
+            total_output_tokens=int(out_tok.sum()),
+            total_input_tokens=int(in_tok.sum()),
+            request_percentiles=request_pcts,
+            itl_percentiles=itl_pcts,
+            ttft_percentiles=ttft_pcts,
             issue_rate_ns=queue_time_total / num_requests)
 
         return stats
@@ -1,7 +1,4 @@
-from .build_cache import BuildCacheConfig
-from .llm import LLM, RequestOutput, SamplingParams
-from .llm_utils import (BuildConfig, CapacitySchedulerPolicy, KvCacheConfig,
-                        QuantAlgo, QuantConfig, SchedulerConfig)
+import importlib
 
 __all__ = [
     'LLM',
@@ -15,3 +12,35 @@ __all__ = [
     'QuantAlgo',
     'BuildCacheConfig',
 ]
+
+# PEP 562 lazy loading: each public symbol is imported from its submodule on
+# first attribute access, so `import tensorrt_llm.hlapi` does not pull in the
+# heavyweight torch/TRT stack until a symbol is actually used.
+_LAZY_SUBMODULES = {
+    'BuildCacheConfig': '.build_cache',
+    'LLM': '.llm',
+    'RequestOutput': '.llm',
+    'SamplingParams': '.llm',
+    'BuildConfig': '.llm_utils',
+    'CapacitySchedulerPolicy': '.llm_utils',
+    'KvCacheConfig': '.llm_utils',
+    'QuantAlgo': '.llm_utils',
+    'QuantConfig': '.llm_utils',
+    'SchedulerConfig': '.llm_utils',
+}
+
+
+def __getattr__(name):
+    try:
+        submodule = _LAZY_SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(submodule, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)